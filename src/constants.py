@@ -37,6 +37,11 @@ PATTERN_FULLY_CONVERGED2 = "fully_converged2"  # access mode (Dell sub-variant)
 PATTERN_SWITCHED = "switched"
 PATTERN_SWITCHLESS = "switchless"
 
+# ── Input format detection ────────────────────────────────────────────────
+# Top-level keys that identify a per-switch standard JSON vs a lab input.
+STANDARD_FORMAT_KEYS: frozenset[str] = frozenset({"switch", "vlans", "interfaces"})
+LAB_FORMAT_KEYS: frozenset[str] = frozenset({"Version", "Description", "InputData"})
+
 # ── Output defaults ──────────────────────────────────────────────────────
 DEFAULT_OUTPUT_DIR = "output"
 OUTPUT_FILE_EXTENSION = ".json"
@@ -82,7 +87,7 @@ BMC_HARDCODED_VLANS: list[dict] = [
 # "UNUSED"/"NATIVE" — reserved VLANs already covered by the hardcoded list
 #                      above, but included so the converter doesn't silently
 #                      drop them if their IDs change in the input.
-BMC_RELEVANT_GROUPS: list[str] = ["BMC", "UNUSED", "NATIVE"]
+BMC_RELEVANT_GROUPS: tuple[str, ...] = ("BMC", "UNUSED", "NATIVE")
 
 # ── IP map key prefixes (used by _build_ip_mapping) ──────────────────────
 # These are assembled at runtime as e.g. "P2P_BORDER1_TOR1", "LOOPBACK0_TOR2"
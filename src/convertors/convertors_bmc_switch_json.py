@@ -17,7 +17,7 @@ from __future__ import annotations
 import ipaddress
 import json
 import logging
-from copy import deepcopy
+from operator import itemgetter
 from pathlib import Path
 
 from ..loader import get_real_path
@@ -30,6 +30,19 @@ from ..utils import infer_firmware
 
 logger = logging.getLogger(__name__)
 
+# Parsed interface templates keyed by path → ((mtime_ns, size), data).
+# Entries are shared — callers must clone before mutating (see _clone_json).
+_TEMPLATE_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def _clone_json(obj):
+    """Copy a JSON-shaped value (dict/list/scalars) — much cheaper than deepcopy."""
+    if isinstance(obj, dict):
+        return {k: _clone_json(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_clone_json(v) for v in obj]
+    return obj
+
 
 class BMCSwitchConverter:
     """Dedicated converter for BMC switches."""
@@ -62,10 +75,9 @@ class BMCSwitchConverter:
     def _convert_single_bmc(self, switch_data: Dict) -> None:
         template_data = self._load_template(switch_data)
         switch_info = self._build_switch_info(switch_data)
-        vlans = self._build_vlans()
+        vlans, static_routes = self._scan_supernets()
         interfaces = self._build_interfaces(template_data)
         port_channels = self._build_port_channels(template_data)
-        static_routes = self._build_static_routes()
 
         bmc_json: dict = {
             "switch": switch_info,
@@ -77,14 +89,19 @@ class BMCSwitchConverter:
 
         hostname = switch_info.get("hostname", "bmc")
         output_file = self.output_dir / f"{hostname}{OUTPUT_FILE_EXTENSION}"
-        output_file.write_text(json.dumps(bmc_json, indent=2), encoding="utf-8")
+        with output_file.open("w", encoding="utf-8") as fh:
+            json.dump(bmc_json, fh, indent=2)
         logger.info("Generated BMC config: %s", output_file)
 
     # -- template loading --------------------------------------------------
 
     @staticmethod
     def _load_template(switch_data: Dict) -> Dict:
-        """Load the model-specific interface template JSON."""
+        """Load the model-specific interface template JSON.
+
+        Parsed templates are cached per path and reused until the file's
+        mtime or size changes.  The returned dict is shared — do not mutate.
+        """
         make = switch_data.get("Make", "").lower()
         model = switch_data.get("Model", "").upper()
 
@@ -92,11 +109,19 @@ class BMCSwitchConverter:
             Path("input/switch_interface_templates") / make / f"{model}.json"
         )
 
-        if not template_path.exists():
+        try:
+            stat = template_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"BMC interface template not found: {template_path} "
                 f"(model={model}, make={make})"
-            )
+            ) from None
+
+        # Re-use the parsed template while the file is unchanged
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = _TEMPLATE_CACHE.get(template_path)
+        if cached and cached[0] == stamp:
+            return cached[1]
 
         try:
             with template_path.open() as fh:
@@ -104,6 +129,7 @@ class BMCSwitchConverter:
         except json.JSONDecodeError as exc:
             raise RuntimeError(f"Invalid JSON in BMC template {template_path}: {exc}") from exc
 
+        _TEMPLATE_CACHE[template_path] = (stamp, template_data)
         logger.info("Loaded BMC interface template: %s", template_path)
         return template_data
 
@@ -125,23 +151,34 @@ class BMCSwitchConverter:
             "site": site.lower() if site else "",
         }
 
-    # -- VLANs -------------------------------------------------------------
+    # -- Supernets (VLANs + static routes) ---------------------------------
 
-    def _build_vlans(self) -> list[dict]:
-        """Build VLAN list.
+    def _scan_supernets(self) -> tuple[list[dict], list[dict]]:
+        """Walk the Supernets once and return ``(vlans, static_routes)``.
 
-        Starts with the hardcoded BMC VLANs (DC4), then appends any extra
-        BMC-relevant VLANs found in the Supernets section.
+        See :meth:`_build_vlans` and :meth:`_build_static_routes` for what
+        each list contains.
         """
-        # Start with hardcoded VLANs (deep-copied to avoid mutation)
-        vlans_out: list[dict] = [deepcopy(v) for v in BMC_HARDCODED_VLANS]
+        # Start with hardcoded VLANs (copied to avoid mutation; entries are flat)
+        vlans_out: list[dict] = [dict(v) for v in BMC_HARDCODED_VLANS]
         hardcoded_ids = {v["vlan_id"] for v in BMC_HARDCODED_VLANS}
+        static_routes: list[dict] = []
 
         supernets = self.input_data.get("InputData", {}).get("Supernets", [])
 
         for net in supernets:
             group_name = net.get("GroupName", "").upper()
             ipv4 = net.get("IPv4", {})
+            is_bmc_group = group_name.startswith("BMC")
+
+            # Default route → gateway of the first BMC supernet that has one
+            if is_bmc_group and not static_routes and ipv4.get("Gateway", ""):
+                static_routes.append({
+                    "prefix": "0.0.0.0/0",
+                    "next_hop": ipv4["Gateway"],
+                    "description": "BMC default gateway",
+                })
+
             vlan_id = ipv4.get("VlanId") or ipv4.get("VLANID") or 0
 
             if vlan_id == 0 or vlan_id in hardcoded_ids:
@@ -156,14 +193,15 @@ class BMCSwitchConverter:
             }
 
             # Add SVI for management VLANs that declare a gateway
-            if group_name.startswith("BMC") and ipv4.get("SwitchSVI", False):
+            if is_bmc_group and ipv4.get("SwitchSVI", False):
                 gateway_ip = ipv4.get("Gateway", "")
                 if gateway_ip:
                     try:
-                        network = ipaddress.IPv4Network(
-                            f"{ipv4.get('Network')}/{ipv4.get('Cidr', 24)}", strict=False
-                        )
-                        bmc_ip = str(network.broadcast_address - 1)
+                        # Last usable host = broadcast - 1 (network | host bits)
+                        network_int = int(ipaddress.IPv4Address(ipv4.get("Network")))
+                        host_bits = 32 - int(ipv4.get("Cidr", 24))
+                        broadcast_int = network_int | ((1 << host_bits) - 1)
+                        bmc_ip = str(ipaddress.IPv4Address(broadcast_int - 1))
                     except (ValueError, TypeError):
                         bmc_ip = gateway_ip
                 else:
@@ -178,11 +216,19 @@ class BMCSwitchConverter:
 
             vlans_out.append(vlan_entry)
 
-        return sorted(vlans_out, key=lambda v: v["vlan_id"])
+        return sorted(vlans_out, key=itemgetter("vlan_id")), static_routes
+
+    def _build_vlans(self) -> list[dict]:
+        """Build VLAN list.
+
+        Starts with the hardcoded BMC VLANs (DC4), then appends any extra
+        BMC-relevant VLANs found in the Supernets section.
+        """
+        return self._scan_supernets()[0]
 
     @staticmethod
     def _is_bmc_relevant_vlan(group_name: str) -> bool:
-        return any(group_name.startswith(prefix) for prefix in BMC_RELEVANT_GROUPS)
+        return group_name.startswith(BMC_RELEVANT_GROUPS)
 
     # -- interfaces --------------------------------------------------------
 
@@ -192,7 +238,7 @@ class BMCSwitchConverter:
         common_templates = template_data.get("interface_templates", {}).get("common", [])
         if not common_templates:
             raise ValueError("No common interfaces found in BMC template")
-        return [deepcopy(t) for t in common_templates]
+        return [_clone_json(t) for t in common_templates]
 
     # -- port channels -----------------------------------------------------
 
@@ -207,7 +253,7 @@ class BMCSwitchConverter:
         input/switch_interface_templates/<vendor>/<model>.json.
         """
         port_channels = template_data.get("port_channels", [])
-        return [deepcopy(pc) for pc in port_channels]
+        return [_clone_json(pc) for pc in port_channels]
 
     # -- static routes -----------------------------------------------------
 
@@ -220,25 +266,7 @@ class BMCSwitchConverter:
         the management network — they don't participate in BGP/OSPF.
         To add more routes, append to the returned list.
         """
-        supernets = self.input_data.get("InputData", {}).get("Supernets", [])
-
-        for net in supernets:
-            group_name = net.get("GroupName", "").upper()
-            if not group_name.startswith("BMC"):
-                continue
-
-            ipv4 = net.get("IPv4", {})
-            gateway = ipv4.get("Gateway", "")
-            if gateway:
-                return [
-                    {
-                        "prefix": "0.0.0.0/0",
-                        "next_hop": gateway,
-                        "description": "BMC default gateway",
-                    }
-                ]
-
-        return []
+        return self._scan_supernets()[1]
 
 
 # ── Module-level convenience function ──────────────────────────────────────
@@ -10,6 +10,7 @@ from __future__ import annotations
 import json
 import logging
 from copy import deepcopy
+from operator import itemgetter
 from pathlib import Path
 from collections import defaultdict
 
@@ -191,7 +192,7 @@ class StandardJSONBuilder:
 
             vlans_out.append(vlan_entry)
 
-        self.sections["vlans"] = sorted(vlans_out, key=lambda v: v["vlan_id"])
+        self.sections["vlans"] = sorted(vlans_out, key=itemgetter("vlan_id"))
         if not self.sections["vlans"]:
             logger.warning("No VLANs produced for %s", switch_type)
 
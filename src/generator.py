@@ -7,7 +7,7 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-from .loader import load_input_json, load_template
+from .loader import load_input_json, get_template_environment
 
 logger = logging.getLogger(__name__)
 
@@ -66,8 +66,9 @@ def generate_config(
 
     output_path.mkdir(parents=True, exist_ok=True)
 
+    env = get_template_environment(template_dir)
     for tpl_path in template_files:
-        template = load_template(str(template_dir), tpl_path.name)
+        template = env.get_template(tpl_path.name)
         rendered = template.render(data)
 
         if not rendered.strip():
@@ -7,12 +7,15 @@ template loading.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from jinja2 import Environment, FileSystemLoader
+if TYPE_CHECKING:
+    from jinja2 import Environment, FileSystemBytecodeCache
 
 logger = logging.getLogger(__name__)
 
@@ -53,12 +56,60 @@ def load_input_json(filepath: str | Path) -> dict:
     return data
 
 
-def load_template(template_dir: str | Path, template_file: str):
-    """Load a single Jinja2 template from *template_dir*.
+def _bytecode_cache(directory: str | None = None) -> FileSystemBytecodeCache | None:
+    """Return an on-disk bytecode cache, or ``None`` if unavailable.
+
+    Compiled templates survive across processes, so repeat runs skip lexing
+    and compiling.  Entries are keyed by template name plus absolute path;
+    each stores the source checksum, and a mismatch forces a recompile, so
+    an edited template is never served stale.  *directory* defaults to a
+    per-user folder in the system temp directory.
+
+    Disabled for frozen builds: Jinja keys entries by absolute template path,
+    and a PyInstaller one-file binary unpacks to a new ``sys._MEIPASS`` on
+    every launch, so each run would only add entries that are never read.
+    """
+    if getattr(sys, "frozen", False):
+        return None
+
+    from jinja2 import FileSystemBytecodeCache
+
+    try:
+        return FileSystemBytecodeCache(directory)
+    except (OSError, RuntimeError) as exc:
+        logger.debug("Jinja2 bytecode cache disabled: %s", exc)
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_environment(real_dir: str) -> Environment:
+    """Return the shared Jinja2 environment for an (already resolved) directory."""
+    # Imported here so JSON-only callers never pay for importing Jinja2
+    from jinja2 import Environment, FileSystemLoader
+
+    # Templates never change during a run — skip the per-lookup mtime check
+    # and never evict, so each template is compiled at most once.
+    return Environment(
+        loader=FileSystemLoader(real_dir), auto_reload=False, cache_size=-1,
+        bytecode_cache=_bytecode_cache(),
+    )
+
+
+def get_template_environment(template_dir: str | Path) -> Environment:
+    """Return the Jinja2 environment for *template_dir*.
 
     The directory is resolved via :func:`get_real_path` so that templates
-    bundled inside a PyInstaller executable are found correctly.
+    bundled inside a PyInstaller executable are found correctly.  One
+    environment is kept per directory, so each template is compiled once
+    per process.
     """
     real_dir = get_real_path(Path(template_dir))
-    env = Environment(loader=FileSystemLoader(str(real_dir)))
-    return env.get_template(template_file)
+    return _get_environment(str(real_dir))
+
+
+def load_template(template_dir: str | Path, template_file: str):
+    """Load a single Jinja2 template from *template_dir*.
+
+    See :func:`get_template_environment` for path resolution and caching.
+    """
+    return get_template_environment(template_dir).get_template(template_file)
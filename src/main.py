@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
+import os
 import shutil
 import sys
 from pathlib import Path
 
+from .constants import LAB_FORMAT_KEYS, STANDARD_FORMAT_KEYS
 from .generator import generate_config
 from .loader import get_real_path, load_input_json
 
@@ -39,7 +42,6 @@ def _configure_windows_console() -> None:
     if sys.platform != "win32":
         return
     try:
-        import os
         os.system("chcp 65001 > nul 2>&1")
         if hasattr(sys.stdout, "reconfigure"):
             sys.stdout.reconfigure(encoding="utf-8", errors="replace")
@@ -69,15 +71,25 @@ def load_convertor(convertor_name: str):
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _accepts_debug(convert_function) -> bool:
+    """Return True if *convert_function* takes a ``debug`` keyword."""
+    import inspect  # only needed on the convert path; cached per function
+
+    return "debug" in inspect.signature(convert_function).parameters
+
+
 # ── format detection ─────────────────────────────────────────────────────
 
 def is_standard_format(data: dict) -> bool:
     """Return True when *data* looks like a per-switch standard JSON."""
     if not isinstance(data, dict):
         return False
-    standard_keys = {"switch", "vlans", "interfaces"}
-    lab_keys = {"Version", "Description", "InputData"}
-    return bool(standard_keys & data.keys()) and not bool(lab_keys & data.keys())
+    # Membership probes short-circuit on the first hit — no key-view intersection
+    return (
+        any(k in data for k in STANDARD_FORMAT_KEYS)
+        and not any(k in data for k in LAB_FORMAT_KEYS)
+    )
 
 
 # ── conversion pipeline ──────────────────────────────────────────────────
@@ -88,24 +100,33 @@ def convert_to_standard_format(
     convertor_module_path: str,
     *,
     debug: bool = False,
+    data: dict | None = None,
 ) -> list[Path]:
-    """Run the lab→standard converter and return generated file paths."""
+    """Run the lab→standard converter and return generated file paths.
+
+    Pass the already-parsed input as *data* to skip re-reading
+    *input_file_path*.
+    """
     _safe_print("Converting from lab format to standard format...")
     _safe_print(f"Using convertor: {convertor_module_path}")
 
-    data = load_input_json(str(input_file_path))
+    if data is None:
+        data = load_input_json(str(input_file_path))
 
     convert_function = load_convertor(convertor_module_path)
 
     # Pass debug flag if the converter supports it
-    import inspect
-    sig = inspect.signature(convert_function)
-    if "debug" in sig.parameters:
+    if _accepts_debug(convert_function):
         convert_function(data, output_dir, debug=debug)
     else:
         convert_function(data, output_dir)
 
-    generated_files = list(Path(output_dir).glob("*.json"))
+    # One scandir pass — d_type answers is_file() without an extra stat
+    with os.scandir(output_dir) as entries:
+        generated_files = [
+            Path(e.path) for e in entries
+            if e.name.endswith(".json") and e.is_file()
+        ]
     if not generated_files:
         raise RuntimeError("No standard format files were generated during conversion")
 
@@ -190,7 +211,8 @@ Examples:
             temp_dir = output_folder_path / ".temp_conversion"
             temp_dir.mkdir(parents=True, exist_ok=True)
             standard_format_files = convert_to_standard_format(
-                input_json_path, str(temp_dir), args.convertor, debug=args.debug,
+                input_json_path, str(temp_dir), args.convertor,
+                debug=args.debug, data=data,
             )
         except Exception as exc:
             _safe_print(f"Failed to convert to standard format: {exc}")
@@ -209,13 +231,15 @@ Examples:
             switch_output_dir = output_folder_path / std_file.stem
             switch_output_dir.mkdir(parents=True, exist_ok=True)
 
+            std_input = std_file
             if conversion_used:
-                std_copy = switch_output_dir / f"std_{std_file.name}"
-                shutil.copy2(std_file, std_copy)
-                _safe_print(f"Standard JSON saved: {std_copy.name}")
+                # The temp file is discarded anyway — move it (same filesystem,
+                # so a rename) instead of copying the bytes.
+                std_input = std_file.replace(switch_output_dir / f"std_{std_file.name}")
+                _safe_print(f"Standard JSON saved: {std_input.name}")
 
             generate_config(
-                input_std_json=str(std_file),
+                input_std_json=str(std_input),
                 template_folder=str(template_folder),
                 output_folder=str(switch_output_dir),
             )
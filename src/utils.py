@@ -7,9 +7,17 @@ converters, loaders, or the CLI entry point.
 
 from __future__ import annotations
 
+import functools
+import re
+
 from .constants import VENDOR_FIRMWARE_MAP, VLAN_GROUP_MAP
 
+# One anchored alternation over every VLAN_GROUP_MAP prefix.  Alternatives
+# keep the map's order, so the first listed prefix still wins on overlap.
+_VLAN_GROUP_PREFIX_RE = re.compile("|".join(map(re.escape, VLAN_GROUP_MAP)))
+
 
+@functools.lru_cache(maxsize=256)
 def infer_firmware(make: str) -> str:
     """Derive firmware identifier from vendor make string.
 
@@ -24,6 +32,7 @@ def infer_firmware(make: str) -> str:
     return VENDOR_FIRMWARE_MAP.get(make_lower, make_lower)
 
 
+@functools.lru_cache(maxsize=256)
 def classify_vlan_group(group_name: str) -> str | None:
     """Map a supernet GroupName to its symbolic VLAN-set key (M, C, S, …).
 
@@ -36,8 +45,5 @@ def classify_vlan_group(group_name: str) -> str | None:
     >>> classify_vlan_group("RANDOM_STUFF") is None
     True
     """
-    upper = group_name.upper()
-    for prefix, symbol in VLAN_GROUP_MAP.items():
-        if upper.startswith(prefix):
-            return symbol
-    return None
+    match = _VLAN_GROUP_PREFIX_RE.match(group_name.upper())
+    return VLAN_GROUP_MAP[match.group()] if match else None
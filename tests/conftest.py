@@ -4,13 +4,20 @@ Shared test fixtures and configuration for the config-generator test suite.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
 import sys
 from pathlib import Path
 
 import pytest
 
+try:
+    import orjson  # optional — faster parsing of the golden/input JSON files
+except ImportError:
+    orjson = None
+
 # ── path setup ────────────────────────────────────────────────────────────
 ROOT_DIR = Path(__file__).resolve().parent.parent
 TEST_CASES_ROOT = ROOT_DIR / "tests" / "test_cases"
@@ -23,34 +30,131 @@ if str(ROOT_DIR) not in sys.path:
 logging.basicConfig(level=logging.WARNING, force=True)
 
 
+def pytest_configure(config):
+    """Register custom markers (deselect end-to-end runs with ``-m "not slow"``)."""
+    config.addinivalue_line(
+        "markers", "slow: end-to-end golden-file tests (converter / generator runs)"
+    )
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _jinja_bytecode_cache(request):
+    """Keep Jinja's bytecode cache under ``.pytest_cache/d/jinja``.
+
+    Golden renders use the stable ``TEMPLATE_ROOT``, so reruns reuse the
+    compiled templates.  The few entries from per-test tmp dirs land there
+    too rather than in the user's temp directory, and ``--cache-clear``
+    removes them.  Disabled when pytest's cache plugin is off.
+    """
+    from src import loader
+
+    cache = getattr(request.config, "cache", None)
+    directory = str(cache.mkdir("jinja")) if cache is not None else None
+    with pytest.MonkeyPatch.context() as mp:
+        if directory is None:
+            mp.setattr(loader, "_bytecode_cache", lambda: None)
+        else:
+            mp.setattr(loader, "_bytecode_cache", functools.partial(loader._bytecode_cache, directory))
+        loader._get_environment.cache_clear()
+        yield
+    loader._get_environment.cache_clear()
+
+
 # ── helpers ───────────────────────────────────────────────────────────────
 
+def find_test_cases(prefix: str) -> list[tuple[str, Path]]:
+    """Return ``(folder_name, input_json_path)`` for case folders starting with *prefix*.
+
+    Uses ``os.scandir`` so discovery is one directory read per level, with
+    file types taken from the directory entries rather than extra stats.
+    """
+    cases = []
+    with os.scandir(TEST_CASES_ROOT) as folders:
+        case_dirs = sorted(
+            (e for e in folders if e.name.startswith(prefix) and e.is_dir()),
+            key=lambda e: e.name,
+        )
+    for folder in case_dirs:
+        with os.scandir(folder.path) as files:
+            inputs = sorted(
+                e.name for e in files
+                if e.name.endswith("_input.json") and e.is_file()
+            )
+        cases.extend((folder.name, Path(folder.path, name)) for name in inputs)
+    return cases
+
+
 def load_json(path: Path) -> dict:
     """Load a JSON file or raise a clear assertion error."""
     assert path.exists(), f"JSON file not found: {path}"
-    return json.loads(path.read_text(encoding="utf-8"))
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+@functools.lru_cache(maxsize=None)
+def load_json_cached(path: Path) -> dict:
+    """Like :func:`load_json`, but parse each file only once per session.
+
+    The returned object is shared between callers — do not mutate it.
+    """
+    return load_json(path)
+
+
+def read_text(path: Path) -> str:
+    """Read a UTF-8 text file, bypassing the ``TextIOWrapper`` codec layer.
+
+    CRLF and lone CR are normalised to LF, matching a text-mode
+    (universal newlines) read.
+    """
+    return path.read_bytes().decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _same_json(expected, actual) -> bool:
+    """True if two JSON subtrees are equal *including* scalar types.
+
+    ``==`` treats ``1``, ``1.0`` and ``True`` as equal, which would hide a
+    nested type change; their reprs differ, so require both to match.
+    """
+    return expected == actual and repr(expected) == repr(actual)
+
+
+def _type_mismatch(expected, actual, path: str) -> list[str]:
+    return [f"Type mismatch at '{path}': expected {type(expected).__name__}, got {type(actual).__name__}"]
 
 
 def find_json_differences(expected, actual, path: str = "", max_diff: int = 10) -> list[str]:
     """Return a list of human-readable differences between two JSON trees."""
     diffs: list[str] = []
 
-    if type(expected) is not type(actual):
-        return [f"Type mismatch at '{path}': expected {type(expected).__name__}, got {type(actual).__name__}"]
-
+    # Dispatch on the expected value — one isinstance check on the hot path.
+    # Equal subtrees need no walk: let the C-level compare settle them (see
+    # _same_json for why == alone is not enough).
     if isinstance(expected, dict):
-        for key in sorted(set(expected) | set(actual)):
+        if not isinstance(actual, dict):
+            return _type_mismatch(expected, actual, path)
+        if _same_json(expected, actual):
+            return diffs
+        # Walk expected keys in document order; only actual-only keys need a
+        # set (sorted so the report stays stable).
+        for key in expected:
             child = f"{path}.{key}" if path else key
-            if key not in expected:
-                diffs.append(f"Unexpected key at '{child}': {actual[key]!r}")
-            elif key not in actual:
+            if key not in actual:
                 diffs.append(f"Missing key at '{child}'")
             else:
                 diffs.extend(find_json_differences(expected[key], actual[key], child, max_diff))
+            if len(diffs) >= max_diff:
+                return diffs[:max_diff]
+        for key in sorted(actual.keys() - expected.keys()):
+            child = f"{path}.{key}" if path else key
+            diffs.append(f"Unexpected key at '{child}': {actual[key]!r}")
             if len(diffs) >= max_diff:
                 break
 
     elif isinstance(expected, list):
+        if not isinstance(actual, list):
+            return _type_mismatch(expected, actual, path)
+        if _same_json(expected, actual):
+            return diffs
         if len(expected) != len(actual):
             diffs.append(f"List length at '{path}': expected {len(expected)}, got {len(actual)}")
         for i in range(min(len(expected), len(actual))):
@@ -58,6 +162,9 @@ def find_json_differences(expected, actual, path: str = "", max_diff: int = 10)
             if len(diffs) >= max_diff:
                 break
 
+    elif type(expected) is not type(actual):
+        return _type_mismatch(expected, actual, path)
+
     elif expected != actual:
         diffs.append(f"Value at '{path}': expected {expected!r}, got {actual!r}")
 
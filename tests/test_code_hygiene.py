@@ -0,0 +1,65 @@
+"""
+Code-hygiene checks over ``src/``.
+
+Logger calls must pass %-style arguments so that messages for disabled
+levels are never formatted.
+"""
+
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from conftest import ROOT_DIR
+
+_LOG_METHODS = frozenset({"debug", "info", "warning", "error", "exception", "critical", "log"})
+
+
+def _is_logger(node: ast.expr) -> bool:
+    """``logger`` / ``log`` / ``logging`` or an attribute such as ``self._logger``."""
+    if isinstance(node, ast.Name):
+        return node.id in ("logger", "log", "logging")
+    return isinstance(node, ast.Attribute) and node.attr.endswith("logger")
+
+
+def _is_eager(node: ast.expr) -> bool:
+    """f-string, ``"..." % x`` or ``"...".format(x)``."""
+    return (
+        isinstance(node, ast.JoinedStr)
+        or (isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mod))
+        or (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "format")
+    )
+
+
+def _eager_log_lines(source: str) -> list[int]:
+    """Line numbers of logger calls whose message is formatted before the call."""
+    lines = []
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) \
+                and node.func.attr in _LOG_METHODS and _is_logger(node.func.value):
+            # Logger.log(level, msg, ...) carries the message second
+            args = node.args[1:] if node.func.attr == "log" else node.args
+            if args and _is_eager(args[0]):
+                lines.append(node.lineno)
+    return lines
+
+
+@pytest.mark.parametrize("snippet, flagged", [
+    ('logger.info(\n    f"x {y}"\n)', True),
+    ('logger.debug("x %s" % y)', True),
+    ('self.logger.warning("x {}".format(y))', True),
+    ('logger.info("x %s", y)', False),
+    ('catalog.error(f"x {y}")', False),
+], ids=["wrapped_fstring", "percent", "format", "deferred", "non_logger"])
+def test_detector(snippet, flagged):
+    assert bool(_eager_log_lines(snippet)) is flagged
+
+
+def test_no_eager_formatting_in_logger_calls():
+    offenders = [
+        f"{py.relative_to(ROOT_DIR)}:{lineno}"
+        for py in sorted((ROOT_DIR / "src").rglob("*.py"))
+        for lineno in _eager_log_lines(py.read_text(encoding="utf-8"))
+    ]
+    assert not offenders, f"Eagerly formatted logger calls: {offenders}"
@@ -10,36 +10,26 @@ The folder must contain:
 from __future__ import annotations
 
 import io
-import json
 import sys
-from pathlib import Path
 
 import pytest
 
-from conftest import TEST_CASES_ROOT, load_json, find_json_differences
+from conftest import TEST_CASES_ROOT, find_test_cases, load_json, load_json_cached, find_json_differences
 
 # ── import converter ──────────────────────────────────────────────────────
+from src.constants import LAB_FORMAT_KEYS
 from src.convertors import convert_lab_switches
 from src.loader import load_input_json
 
 
 # ── discover test cases ───────────────────────────────────────────────────
 
-def _find_convert_cases() -> list[tuple[str, Path]]:
-    cases = []
-    for folder in sorted(TEST_CASES_ROOT.iterdir()):
-        if not folder.is_dir() or not folder.name.startswith("convert_"):
-            continue
-        for input_file in folder.glob("*_input.json"):
-            cases.append((folder.name, input_file))
-    return cases
-
-
-_ALL_CASES = _find_convert_cases()
+_ALL_CASES = find_test_cases("convert_")
 
 
 # ── parametrised tests ────────────────────────────────────────────────────
 
+@pytest.mark.slow
 @pytest.mark.parametrize("case", _ALL_CASES, ids=lambda c: c[0])
 def test_convert_golden(case, tmp_path):
     """Convert lab JSON → standard JSON and compare against expected output."""
@@ -47,8 +37,8 @@ def test_convert_golden(case, tmp_path):
     expected_dir = TEST_CASES_ROOT / folder_name / "expected_outputs"
 
     # Load & convert
-    input_data = load_json(input_file)
-    assert {"Version", "Description", "InputData"} & input_data.keys(), \
+    input_data = load_json_cached(input_file)
+    assert not LAB_FORMAT_KEYS.isdisjoint(input_data), \
         f"Input does not look like lab format: {input_file}"
 
     # Suppress converter stdout
@@ -68,8 +58,8 @@ def test_convert_golden(case, tmp_path):
         if not exp_file.exists():
             continue  # extra files are OK — new switches added
 
-        expected = json.loads(exp_file.read_text("utf-8"))
-        actual = json.loads(gen_file.read_text("utf-8"))
+        expected = load_json(exp_file)
+        actual = load_json(gen_file)
 
         # Strip debug section from both sides (DC6)
         expected.pop("debug", None)
@@ -90,6 +80,6 @@ def test_convert_golden(case, tmp_path):
 def test_input_is_lab_format(case):
     """Verify that each test input is valid lab-format JSON."""
     _, input_file = case
-    data = load_json(input_file)
-    missing = {"Version", "Description", "InputData"} - data.keys()
+    data = load_json_cached(input_file)
+    missing = LAB_FORMAT_KEYS - data.keys()
     assert not missing, f"Missing lab-format keys: {missing}"
@@ -6,66 +6,56 @@ The folder contains:
   - A ``*_input.json`` file (standard format)
   - ``expected_<section>.cfg`` golden files for comparison
 
-Generation runs at test-time into ``tmp_path`` for isolation —
-no files are written into the source tree.
+Generation runs once per case at test-time into a temporary directory that
+is shared by the tests of that case — no files are written into the source
+tree.
 """
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 
-from conftest import TEST_CASES_ROOT, TEMPLATE_ROOT, find_text_differences
+from conftest import TEST_CASES_ROOT, TEMPLATE_ROOT, find_test_cases, find_text_differences, read_text
 from src.generator import generate_config
 
+pytestmark = pytest.mark.slow
 
-# ── discover test cases (no side effects) ─────────────────────────────────
 
-def _find_std_cases() -> list[tuple[str, Path]]:
-    """Return (folder_name, input_json_path) for every std_* test case."""
-    cases = []
-    for folder in sorted(TEST_CASES_ROOT.iterdir()):
-        if not folder.is_dir() or not folder.name.startswith("std_"):
-            continue
-        for input_file in folder.glob("*_input.json"):
-            cases.append((folder.name, input_file))
-    return cases
+# ── discover test cases (no side effects) ─────────────────────────────────
 
+_STD_CASES = find_test_cases("std_")
 
-_STD_CASES = _find_std_cases()
 
+# ── fixtures ──────────────────────────────────────────────────────────────
 
-# ── tests ─────────────────────────────────────────────────────────────────
+@pytest.fixture(scope="module", params=_STD_CASES, ids=[c[0] for c in _STD_CASES])
+def generated_case(request, tmp_path_factory):
+    """Run the generator once per case and share the output across tests.
 
-@pytest.mark.parametrize(
-    "folder_name, input_file",
-    _STD_CASES,
-    ids=[c[0] for c in _STD_CASES],
-)
-def test_generation_succeeds(folder_name, input_file, tmp_path):
-    """Generator runs without error and produces at least one .cfg file."""
+    Returns ``(folder_name, output_dir)``.
+    """
+    folder_name, input_file = request.param
+    output_dir = tmp_path_factory.mktemp(folder_name)
     generate_config(
         input_std_json=str(input_file),
         template_folder=str(TEMPLATE_ROOT),
-        output_folder=str(tmp_path),
+        output_folder=str(output_dir),
     )
-    generated = list(tmp_path.glob("generated_*.cfg"))
+    return folder_name, output_dir
+
+
+# ── tests ─────────────────────────────────────────────────────────────────
+
+def test_generation_succeeds(generated_case):
+    """Generator runs without error and produces at least one .cfg file."""
+    folder_name, output_dir = generated_case
+    generated = list(output_dir.glob("generated_*.cfg"))
     assert generated, f"No .cfg files generated for {folder_name}"
 
 
-@pytest.mark.parametrize(
-    "folder_name, input_file",
-    _STD_CASES,
-    ids=[c[0] for c in _STD_CASES],
-)
-def test_golden_file_comparison(folder_name, input_file, tmp_path):
+def test_golden_file_comparison(generated_case):
     """Compare every expected_<section>.cfg against its generated output."""
-    generate_config(
-        input_std_json=str(input_file),
-        template_folder=str(TEMPLATE_ROOT),
-        output_folder=str(tmp_path),
-    )
+    folder_name, output_dir = generated_case
 
     case_dir = TEST_CASES_ROOT / folder_name
     expected_files = sorted(case_dir.glob("expected_*.cfg"))
@@ -76,14 +66,14 @@ def test_golden_file_comparison(folder_name, input_file, tmp_path):
     errors = []
     for exp_file in expected_files:
         section = exp_file.stem.replace("expected_", "")
-        gen_file = tmp_path / f"generated_{section}.cfg"
+        gen_file = output_dir / f"generated_{section}.cfg"
 
         if not gen_file.exists():
             errors.append(f"Section '{section}': generated file missing")
             continue
 
-        expected_text = exp_file.read_text("utf-8").strip()
-        generated_text = gen_file.read_text("utf-8").strip()
+        expected_text = read_text(exp_file).strip()
+        generated_text = read_text(gen_file).strip()
 
         if expected_text != generated_text:
             diffs = find_text_differences(expected_text, generated_text)
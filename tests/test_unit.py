@@ -2,7 +2,7 @@
 Unit tests for the config-generator core modules.
 
 Organized by module under test:
-  1. Utility functions — infer_firmware, classify_vlan_group
+  1. Utility functions — infer_firmware, classify_vlan_group, is_standard_format
   2. Loader — load_input_json, get_real_path
   3. Constants — sanity checks on shared config values
   4. BMC Converter — switch_info, vlans, interfaces, port_channels, static_routes
@@ -14,6 +14,7 @@ All test data uses generic/sanitized values — no lab-specific identifiers.
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -30,7 +31,11 @@ from src.constants import (
     SWITCH_TEMPLATE, SVI_TEMPLATE, VLAN_TEMPLATE,
 )
 from src.utils import infer_firmware, classify_vlan_group
-from src.loader import load_input_json, get_real_path
+from src.main import is_standard_format
+from src.loader import (
+    load_input_json, load_template, get_template_environment, get_real_path,
+    _bytecode_cache,
+)
 from src.convertors.convertors_bmc_switch_json import BMCSwitchConverter
 from src.convertors.convertors_lab_switch_json import StandardJSONBuilder
 
@@ -145,6 +150,21 @@ class TestClassifyVlanGroup:
         assert classify_vlan_group(group_name) is None
 
 
+class TestIsStandardFormat:
+    """Distinguishes per-switch standard JSON from lab-format input."""
+
+    @pytest.mark.parametrize("data, expected", [
+        ({"switch": {}, "vlans": []},              True),
+        ({"interfaces": []},                       True),
+        ({"Version": "1", "InputData": {}},        False),   # lab format
+        ({"switch": {}, "Description": ""},        False),   # lab key wins
+        ({},                                       False),
+        (["switch"],                               False),   # not a dict
+    ])
+    def test_detection(self, data, expected):
+        assert is_standard_format(data) is expected
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 #  2. Loader
 # ═══════════════════════════════════════════════════════════════════════════
@@ -180,6 +200,44 @@ class TestGetRealPath:
         assert str(get_real_path(Path("input/templates"))) == "/fake/meipass/input/templates"
 
 
+class TestLoadTemplate:
+    """Jinja2 template loading."""
+
+    def test_renders_template(self, tmp_path):
+        (tmp_path / "t.j2").write_text("hostname {{ name }}", encoding="utf-8")
+        assert load_template(tmp_path, "t.j2").render(name="sw1") == "hostname sw1"
+
+    def test_compiles_each_template_once(self, tmp_path):
+        (tmp_path / "t.j2").write_text("x", encoding="utf-8")
+        assert load_template(tmp_path, "t.j2") is load_template(str(tmp_path), "t.j2")
+
+    def test_one_environment_per_directory(self, tmp_path):
+        assert get_template_environment(tmp_path) is get_template_environment(str(tmp_path))
+
+    def test_no_bytecode_cache_when_frozen(self, monkeypatch):
+        # One-file builds unpack to a fresh _MEIPASS per launch — never a hit
+        monkeypatch.setattr(sys, "frozen", True, raising=False)
+        assert _bytecode_cache() is None
+
+    def test_bytecode_cache_when_not_frozen(self, monkeypatch, tmp_path):
+        from jinja2 import FileSystemBytecodeCache
+
+        monkeypatch.delattr(sys, "frozen", raising=False)
+        cache = _bytecode_cache(str(tmp_path))
+        assert isinstance(cache, FileSystemBytecodeCache)
+        assert cache.directory == str(tmp_path)
+
+    def test_no_bytecode_cache_when_dir_unusable(self, monkeypatch):
+        import jinja2
+
+        def _fail(*_args, **_kwargs):
+            raise OSError("no temp dir")
+
+        monkeypatch.delattr(sys, "frozen", raising=False)
+        monkeypatch.setattr(jinja2, "FileSystemBytecodeCache", _fail)
+        assert _bytecode_cache() is None
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 #  3. Constants
 # ═══════════════════════════════════════════════════════════════════════════
@@ -258,6 +316,24 @@ class TestBMCVlans:
         assert v125["interface"]["cidr"] == 24
         assert v125["interface"]["mtu"] == JUMBO_MTU
 
+    @pytest.mark.parametrize("network, cidr, expected_ip", [
+        ("10.0.0.0",   24, "10.0.0.254"),
+        ("10.0.0.0",   26, "10.0.0.62"),
+        ("10.0.0.64",  26, "10.0.0.126"),
+        ("10.0.0.5",   24, "10.0.0.254"),   # host bits set — non-strict
+    ])
+    def test_svi_ip_is_last_usable_host(self, tmp_path, network, cidr, expected_ip):
+        data = _make_bmc_input(bmc_network=network, bmc_cidr=cidr)
+        conv = BMCSwitchConverter(data, str(tmp_path))
+        v125 = next(v for v in conv._build_vlans() if v["vlan_id"] == 125)
+        assert v125["interface"]["ip"] == expected_ip
+
+    def test_svi_ip_falls_back_to_gateway_on_bad_network(self, tmp_path):
+        data = _make_bmc_input(bmc_network="not-an-ip", bmc_gateway="10.0.0.1")
+        conv = BMCSwitchConverter(data, str(tmp_path))
+        v125 = next(v for v in conv._build_vlans() if v["vlan_id"] == 125)
+        assert v125["interface"]["ip"] == "10.0.0.1"
+
     def test_vlans_sorted_by_id(self, bmc_converter):
         ids = [v["vlan_id"] for v in bmc_converter._build_vlans()]
         assert ids == sorted(ids)
@@ -294,7 +370,39 @@ class TestBMCPortChannels:
         original = [{"id": 1, "members": ["1/1"]}]
         pcs = BMCSwitchConverter._build_port_channels({"port_channels": original})
         pcs[0]["id"] = 999
+        pcs[0]["members"].append("1/2")
         assert original[0]["id"] == 1
+        assert original[0]["members"] == ["1/1"]
+
+
+class TestBMCLoadTemplate:
+    """BMCSwitchConverter._load_template — per-model template loading and caching."""
+
+    _SWITCH = {"Make": "Cisco", "Model": "test-model"}
+
+    @pytest.fixture
+    def template_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path / "input" / "switch_interface_templates" / "cisco" / "TEST-MODEL.json"
+        path.parent.mkdir(parents=True)
+        path.write_text('{"port_channels": [{"id": 1}]}', encoding="utf-8")
+        return path
+
+    def test_raises_when_template_missing(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        with pytest.raises(FileNotFoundError, match="BMC interface template not found"):
+            BMCSwitchConverter._load_template(self._SWITCH)
+
+    def test_reuses_parsed_template(self, template_file):
+        first = BMCSwitchConverter._load_template(self._SWITCH)
+        assert BMCSwitchConverter._load_template(self._SWITCH) is first
+
+    def test_reloads_when_file_changes(self, template_file):
+        assert BMCSwitchConverter._load_template(self._SWITCH)["port_channels"] == [{"id": 1}]
+        mtime_ns = template_file.stat().st_mtime_ns
+        template_file.write_text('{"port_channels": [{"id": 2}]}', encoding="utf-8")
+        os.utime(template_file, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        assert BMCSwitchConverter._load_template(self._SWITCH)["port_channels"] == [{"id": 2}]
 
 
 class TestBMCStaticRoutes: